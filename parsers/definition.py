@@ -1,4 +1,5 @@
 from __future__ import annotations
+from array import array
 from dataclasses import dataclass
 from functools import reduce
 from multiprocessing.sharedctypes import Value
@@ -338,3 +339,139 @@ def move_to(trigger: str):
         return Success((nd, None))
 
     return Parser(f"Move to {trigger}", parser)
+
+
+# ------------------------------------------------------------
+# Bulk numeric extraction
+
+
+def _peek(data: FileData) -> str:
+    try:
+        return data._current_character()
+    except (KeyError, IndexError):
+        return ""
+
+
+def _consume(data: FileData, literal: str) -> bool:
+    for c in literal:
+        if _peek(data) != c:
+            return False
+        data._next_character_cursor()
+    return True
+
+
+def _consume_digits(data: FileData) -> str:
+    digits = ""
+    while (c := _peek(data)).isdigit():
+        digits += c
+        data._next_character_cursor()
+    return digits
+
+
+def _scan_number(data: FileData, fractional: bool) -> "tuple[FileData, str]":
+    """Scan a number literal starting at the cursor of *data*
+
+    Returns the data after the literal and its text, which is empty if no
+    number starts at the cursor.
+    """
+    current = data.copy()
+    sign = _peek(current) if _peek(current) in ("+", "-") else ""
+    _consume(current, sign)
+    text = sign + _consume_digits(current)
+
+    if fractional and _peek(current) == ".":
+        probe = current.copy()
+        probe._next_character_cursor()
+        if decimals := _consume_digits(probe):
+            current, text = probe, f"{text}.{decimals}"
+
+    if text in ("", sign):
+        return (data, "")
+
+    if fractional and _peek(current) in ("e", "E"):
+        probe = current.copy()
+        exponent = probe._current_character()
+        probe._next_character_cursor()
+        if (c := _peek(probe)) in ("+", "-"):
+            exponent += c
+            probe._next_character_cursor()
+        if exp_digits := _consume_digits(probe):
+            current, text = probe, text + exponent + exp_digits
+
+    return (current, text)
+
+
+def many_numbers(sep: str = ",", typecode: str = "d", n: int = 0):
+    """Parse a run of numbers seperated by *sep* into an ``array.array``
+
+    The run is scanned in a single pass without creating a Success per value,
+    so the result stays compact and can be consumed by vectorized code
+    directly. Fails like ``atleast`` if fewer than *n* numbers are found.
+
+    Args:
+        sep (str): seperator between numbers, a trailing one is not consumed
+        typecode (str): typecode of the resulting array, "f" and "d" allow
+            fractions and exponents, all others only integers
+        n (int): minimum amount of numbers
+    """
+    fractional = typecode in ("f", "d")
+    convert = float if fractional else int
+    _label = f"Atleast {n} times Number seperated by {sep!r}"
+
+    def parser(data: FileData):
+        values = array(typecode)
+        last = data
+        current = data
+
+        while 1:
+            after, text = _scan_number(current, fractional)
+            if not text:
+                break
+            try:
+                values.append(convert(text))
+            except OverflowError:
+                return Error(
+                    PError(
+                        current.cursor,
+                        _label,
+                        f"{text} out of range for typecode {typecode}",
+                    )
+                )
+            last = after
+            current = after.copy()
+            if not _consume(current, sep):
+                break
+
+        if len(values) < n:
+            return Error(
+                PError(
+                    data.cursor,
+                    _label,
+                    f"expected atleast {n} but got only {len(values)}",
+                )
+            )
+        return Success((last, values))
+
+    return Parser(_label, parser)
+
+
+def int_column(sep: str = "\n", n: int = 0) -> "Parser[array[int]]":
+    """Signed 64 bit integers seperated by *sep*, see ``many_numbers``"""
+    _label = f"Atleast {n} times Integer seperated by {sep!r}"
+    return many_numbers(sep, "q", n) % _label
+
+
+def float_column(sep: str = "\n", n: int = 0) -> "Parser[array[float]]":
+    """Double precision floats seperated by *sep*, see ``many_numbers``"""
+    _label = f"Atleast {n} times Float seperated by {sep!r}"
+    return many_numbers(sep, "d", n) % _label
+
+
+def as_numpy(p: "Parser[array[Any]]"):
+    """Expose the array result of *p* as numpy.ndarray without copying
+
+    Requires the optional numpy dependency.
+    """
+    import numpy
+
+    return p >> (lambda values: numpy.frombuffer(values, dtype=values.typecode))
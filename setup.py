@@ -9,5 +9,6 @@ setup(
         "FileData @ git+https://github.com/Ascedete/FileData.git@master",
         "Result @ git+https://github.com/Ascedete/Result.git@master",
     ],
+    extras_require={"numpy": ["numpy"]},
     url="https://github.com/Ascedete/Parsers",
 )
@@ -297,3 +297,31 @@ def test_skip():
     nd = FileData("    asnbs   \n")
     res = p(nd)
     assert res.val[1] == "asnbs"
+
+
+def test_many_numbers():
+    nd = FileData("1,2.5,-3e2,4e,")
+    res = many_numbers(",")(nd)
+    assert res
+    assert res.val[1] == array("d", [1.0, 2.5, -300.0, 4.0])
+    rest = many(any())(res.val[0])
+    assert rest.val[1] == ["e", ","]
+
+    res = int_column(n=3)(FileData("1\n-2\n+3\nx"))
+    assert res
+    assert res.val[1] == array("q", [1, -2, 3])
+
+    res = int_column(n=4)(FileData("1\n-2\n+3\nx"))
+    assert not res
+    assert res.val.reason == "expected atleast 4 but got only 3"
+
+    res = int_column()(FileData("99999999999999999999999"))
+    assert not res
+
+
+def test_as_numpy():
+    numpy = pytest.importorskip("numpy")
+    res = as_numpy(float_column(", "))(FileData("0.5, 1, 2e1"))
+    assert res
+    assert isinstance(res.val[1], numpy.ndarray)
+    assert list(res.val[1]) == [0.5, 1.0, 20.0]